@@ -5,11 +5,49 @@ This is the entry point of the application.
 It sets up the FastAPI app, CORS middleware, and defines the API routes.
 """
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.orchestrator import process_text
 from app.schemas import HealthResponse, VerifyRequest, VerifyResponse
+from app.services import wikipedia_service
+
+# ============================================
+# Application Lifespan (Startup / Shutdown)
+# ============================================
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Runs when the application starts and shuts down.
+
+    On startup, warms up shared resources so the first request
+    doesn't pay for them:
+    - A shared HTTP client with an open connection to Wikipedia
+    - The spaCy NLP pipeline (if installed)
+
+    On shutdown, closes the HTTP client.
+    """
+    print("🚀 AI Trust Layer API starting up...")
+
+    # The client is closed on shutdown, and also if startup fails below
+    async with wikipedia_service.create_http_client() as client:
+        app.state.http = client
+        await wikipedia_service.warm_up(client)
+
+        # Load the NLP pipeline now; get_nlp() caches it for the verification
+        # pipeline. Model loading is slow and blocking - keep it off the loop
+        await asyncio.to_thread(wikipedia_service.get_nlp)
+
+        print("📚 Documentation available at /docs")
+        yield
+
+        print("👋 AI Trust Layer API shutting down...")
+
 
 # ============================================
 # Create FastAPI Application
@@ -21,6 +59,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc alternative docs
+    lifespan=lifespan,
 )
 
 # ============================================
@@ -76,7 +115,7 @@ async def health_check():
 
 
 @app.post("/verify", response_model=VerifyResponse, tags=["Verification"])
-async def verify_content(request: VerifyRequest):
+async def verify_content(request: VerifyRequest, http_request: Request):
     """
     Main verification endpoint.
 
@@ -102,34 +141,14 @@ async def verify_content(request: VerifyRequest):
     # Process the text through our verification pipeline
     # The orchestrator coordinates all services
     try:
-        result = process_text(request.text)
+        # The shared client only exists once the lifespan has run (not e.g.
+        # in a sub-application); without it the service opens its own
+        result = await process_text(
+            request.text, http_client=getattr(http_request.app.state, "http", None)
+        )
         return result
     except Exception as e:
         # Log the error in production
         raise HTTPException(
             status_code=500, detail=f"An error occurred during verification: {str(e)}"
         )
-
-
-# ============================================
-# Application Startup Event (Optional)
-# ============================================
-
-
-@app.on_event("startup")
-async def startup_event():
-    """
-    Runs when the application starts.
-    Useful for initialization tasks.
-    """
-    print("🚀 AI Trust Layer API starting up...")
-    print("📚 Documentation available at /docs")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Runs when the application shuts down.
-    Useful for cleanup tasks.
-    """
-    print("👋 AI Trust Layer API shutting down...")
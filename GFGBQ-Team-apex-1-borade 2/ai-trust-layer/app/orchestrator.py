@@ -5,12 +5,34 @@ This is the central workflow controller that coordinates all services.
 It manages the flow: text → claims → citation check → verification → scoring
 """
 
-from typing import Any, Dict, List
+import bisect
+import re
+from typing import Any, Dict, List, Optional
+
+import httpx
 
 from app import scoring
 from app.schemas import ClaimResult, ClaimStatus, ReliabilityLabel, VerifyResponse
 from app.services import citation_service, claim_service, wikipedia_service
 
+# Status string -> enum member, built once instead of calling ClaimStatus() per claim
+_STATUS_MAP: Dict[str, ClaimStatus] = {status.value: status for status in ClaimStatus}
+
+# Markers that suggest a claim carries its own citation (all lowercase)
+CITATION_MARKERS = ("[", "(", "http", "www", "according to", "source:")
+
+# All markers checked with a single scan of the lowercased claim
+# (re.IGNORECASE would make the scan slower than lowering once)
+_CITATION_MARKER_RE = re.compile("|".join(map(re.escape, CITATION_MARKERS)))
+
+# Reliability labels per scoring.RELIABILITY_BOUNDS bucket, lowest first
+_RELIABILITY_LABELS = (
+    ReliabilityLabel.UNRELIABLE,
+    ReliabilityLabel.QUESTIONABLE,
+    ReliabilityLabel.MOSTLY_RELIABLE,
+    ReliabilityLabel.HIGHLY_RELIABLE,
+)
+
 
 class TrustOrchestrator:
     """
@@ -23,7 +45,15 @@ class TrustOrchestrator:
     4. Calculating the trust score
     """
 
-    def process(self, text: str) -> VerifyResponse:
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            http_client: Shared HTTP client for Wikipedia lookups
+                (a client is opened per request if omitted)
+        """
+        self.http_client = http_client
+
+    async def process(self, text: str) -> VerifyResponse:
         """
         Main orchestration method that processes AI-generated text.
 
@@ -57,24 +87,26 @@ class TrustOrchestrator:
             )
 
         # Step 4: Verify each claim using Wikipedia
-        verified_claims = wikipedia_service.verify_claims_with_wikipedia(
-            claims_with_citations
+        verified_claims = await wikipedia_service.verify_claims_with_wikipedia(
+            claims_with_citations, client=self.http_client
         )
 
-        # Step 5: Calculate trust score
-        trust_score = scoring.calculate_trust_score(verified_claims)
+        # Step 5: Calculate trust score (status counts are shared with step 7)
+        status_counts = scoring.count_statuses(verified_claims)
+        trust_score = scoring.calculate_trust_score(verified_claims, status_counts)
 
         # Step 6: Get reliability label based on score
         reliability_label = self._get_reliability_label(trust_score)
 
         # Step 7: Get breakdown statistics
-        breakdown = scoring.get_score_breakdown(verified_claims)
+        breakdown = scoring.get_score_breakdown(verified_claims, status_counts)
 
         # Step 8: Build claim results for response
         claim_results = self._build_claim_results(verified_claims)
 
-        # Step 9: Build and return the final response
-        return VerifyResponse(
+        # Step 9: Build and return the final response. Every value was
+        # produced by our own services, so skip re-validating it here.
+        return VerifyResponse.model_construct(
             trust_score=trust_score,
             reliability_label=reliability_label,
             total_claims=breakdown["total_claims"],
@@ -108,40 +140,37 @@ class TrustOrchestrator:
             return False
 
         # Check if claim contains citation markers
-        citation_markers = ["[", "(", "http", "www", "according to", "source:"]
-        claim_lower = claim_text.lower()
-        return any(marker in claim_lower for marker in citation_markers)
+        return bool(_CITATION_MARKER_RE.search(claim_text.lower()))
 
     def _get_reliability_label(self, trust_score: int) -> ReliabilityLabel:
         """
         Convert numeric trust score to reliability label enum.
         """
-        if trust_score >= 80:
-            return ReliabilityLabel.HIGHLY_RELIABLE
-        elif trust_score >= 60:
-            return ReliabilityLabel.MOSTLY_RELIABLE
-        elif trust_score >= 40:
-            return ReliabilityLabel.QUESTIONABLE
-        else:
-            return ReliabilityLabel.UNRELIABLE
+        return _RELIABILITY_LABELS[
+            bisect.bisect_right(scoring.RELIABILITY_BOUNDS, trust_score)
+        ]
 
     def _build_claim_results(
         self, verified_claims: List[Dict[str, Any]]
     ) -> List[ClaimResult]:
         """
         Convert verified claim dictionaries to ClaimResult schema objects.
+
+        Uses model_construct to skip validation: statuses are mapped to the
+        enum above and the verification services keep confidence within [0, 1].
         """
         results = []
         for claim in verified_claims:
             # Map status string to enum
-            status_str = claim.get("status", "UNKNOWN")
-            status = ClaimStatus(status_str)
+            status = _STATUS_MAP.get(
+                claim.get("status", "UNKNOWN"), ClaimStatus.UNKNOWN
+            )
 
             # Get Wikipedia source info
             wiki_source = claim.get("wikipedia_source")
             wiki_snippet = claim.get("wikipedia_snippet")
 
-            result = ClaimResult(
+            result = ClaimResult.model_construct(
                 claim_text=claim.get("text", ""),
                 status=status,
                 reason=claim.get("reason", "No reason provided"),
@@ -156,9 +185,11 @@ class TrustOrchestrator:
 
 
 # For backwards compatibility, also provide a function interface
-def process_text(text: str) -> VerifyResponse:
+async def process_text(
+    text: str, http_client: Optional[httpx.AsyncClient] = None
+) -> VerifyResponse:
     """
     Convenience function to process text without instantiating orchestrator.
     """
-    orchestrator = TrustOrchestrator()
-    return orchestrator.process(text)
+    orchestrator = TrustOrchestrator(http_client)
+    return await orchestrator.process(text)
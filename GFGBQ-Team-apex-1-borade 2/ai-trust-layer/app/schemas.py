@@ -6,7 +6,7 @@ These define the structure of data flowing through the API.
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ============================================
 # Enums for Status Values
@@ -101,8 +101,13 @@ class ClaimResult(BaseModel):
     """
     Result for a single claim in the API response.
     Contains the claim, its verification status, and reasoning.
+
+    Frozen: results are built once by the orchestrator (via model_construct,
+    from already-checked values) and never modified afterwards.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     claim_text: str = Field(..., description="The extracted factual claim")
     status: ClaimStatus = Field(
         ..., description="Verification status: VERIFIED, CONTRADICTED, or UNKNOWN"
@@ -5,7 +5,9 @@ Calculates the overall trust score based on claim verification results.
 Uses a simple weighted average approach for beginner-friendliness.
 """
 
-from typing import Any, Dict, List
+import bisect
+from collections import Counter
+from typing import Any, Dict, List, Optional
 
 # Status weights for scoring (higher = more trustworthy)
 STATUS_WEIGHTS = {
@@ -14,13 +16,43 @@ STATUS_WEIGHTS = {
     "CONTRADICTED": 0,  # Claim appears to be false
 }
 
+# Reliability buckets: a score >= RELIABILITY_BOUNDS[i] gets _RL_LABELS[i + 1].
+# Also used by the orchestrator for its ReliabilityLabel enum.
+RELIABILITY_BOUNDS = (40, 60, 80)
+_RL_LABELS = (
+    "VERY LOW - Content contains contradicted claims",
+    "LOW - Multiple unverified claims",
+    "MEDIUM - Some claims need verification",
+    "HIGH - Content appears reliable",
+)
 
-def calculate_trust_score(verified_claims: List[Dict[str, Any]]) -> int:
+
+def count_statuses(verified_claims: List[Dict[str, Any]]) -> Counter:
+    """
+    Count claims by verification status in a single pass.
+
+    Build this once per request and pass it to both calculate_trust_score
+    and get_score_breakdown so the claim list is only walked once.
+
+    Args:
+        verified_claims: List of claims with their verification status
+
+    Returns:
+        Counter mapping status to number of claims
+    """
+    return Counter(claim.get("status", "UNKNOWN") for claim in verified_claims)
+
+
+def calculate_trust_score(
+    verified_claims: List[Dict[str, Any]],
+    counts: Optional[Counter] = None,
+) -> int:
     """
     Calculate overall trust score from verified claims.
 
     Args:
         verified_claims: List of claims with their verification status
+        counts: Optional status counts from count_statuses
 
     Returns:
         Trust score from 0 to 100
@@ -29,14 +61,21 @@ def calculate_trust_score(verified_claims: List[Dict[str, Any]]) -> int:
     if not verified_claims:
         return 50  # Neutral score when nothing to verify
 
-    # Calculate weighted average of all claim scores
-    total_score = 0
-    for claim in verified_claims:
-        status = claim.get("status", "UNKNOWN")
-        total_score += STATUS_WEIGHTS.get(status, 50)
+    if counts is None:
+        counts = count_statuses(verified_claims)
+
+    # Weighted average; any other status counts as UNKNOWN (neutral)
+    total = len(verified_claims)
+    verified = counts["VERIFIED"]
+    contradicted = counts["CONTRADICTED"]
+    total_score = (
+        verified * STATUS_WEIGHTS["VERIFIED"]
+        + (total - verified - contradicted) * STATUS_WEIGHTS["UNKNOWN"]
+        + contradicted * STATUS_WEIGHTS["CONTRADICTED"]
+    )
 
     # Return average score (integer)
-    return total_score // len(verified_claims)
+    return total_score // total
 
 
 def get_reliability_label(trust_score: int) -> str:
@@ -49,40 +88,34 @@ def get_reliability_label(trust_score: int) -> str:
     Returns:
         Human-readable reliability label
     """
-    if trust_score >= 80:
-        return "HIGH - Content appears reliable"
-    elif trust_score >= 60:
-        return "MEDIUM - Some claims need verification"
-    elif trust_score >= 40:
-        return "LOW - Multiple unverified claims"
-    else:
-        return "VERY LOW - Content contains contradicted claims"
+    return _RL_LABELS[bisect.bisect_right(RELIABILITY_BOUNDS, trust_score)]
 
 
-def get_score_breakdown(verified_claims: List[Dict[str, Any]]) -> Dict[str, int]:
+def get_score_breakdown(
+    verified_claims: List[Dict[str, Any]],
+    counts: Optional[Counter] = None,
+) -> Dict[str, int]:
     """
     Get count of claims by status for transparency.
 
     Args:
         verified_claims: List of claims with their verification status
+        counts: Optional status counts from count_statuses
 
     Returns:
         Dictionary with counts per status
     """
-    breakdown = {
-        "verified_count": 0,
-        "contradicted_count": 0,
-        "unknown_count": 0,
-        "total_claims": len(verified_claims),
+    if counts is None:
+        counts = count_statuses(verified_claims)
+
+    total = len(verified_claims)
+    verified = counts["VERIFIED"]
+    contradicted = counts["CONTRADICTED"]
+
+    return {
+        "verified_count": verified,
+        "contradicted_count": contradicted,
+        # Anything that is not VERIFIED/CONTRADICTED is reported as unknown
+        "unknown_count": total - verified - contradicted,
+        "total_claims": total,
     }
-
-    for claim in verified_claims:
-        status = claim.get("status", "UNKNOWN")
-        if status == "VERIFIED":
-            breakdown["verified_count"] += 1
-        elif status == "CONTRADICTED":
-            breakdown["contradicted_count"] += 1
-        else:
-            breakdown["unknown_count"] += 1
-
-    return breakdown
@@ -6,7 +6,44 @@ Uses mock/placeholder logic - no real NLP models.
 """
 
 import re
-from typing import List
+from typing import Iterator, List
+
+# Pre-compiled patterns (compiled once at import instead of per call)
+# Whitespace following ., ! or ? separates sentences
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+_NUMBER_RE = re.compile(r"\d+")
+
+# Phrases that mark a sentence as an opinion (mock logic)
+OPINION_MARKERS = ["i think", "i believe", "in my opinion", "maybe", "perhaps"]
+
+# Words that suggest a sentence states a fact (mock heuristic)
+# In reality, this would be much more sophisticated
+FACTUAL_INDICATORS = [
+    "is",
+    "are",
+    "was",
+    "were",
+    "has",
+    "have",
+    "had",
+    "percent",
+    "%",
+    "million",
+    "billion",
+    "year",
+    "founded",
+    "located",
+    "discovered",
+    "invented",
+    "created",
+    "published",
+]
+
+# Each list is checked with one alternation scan over the lowercased sentence
+# (re.IGNORECASE makes the scan several times slower than lowering once).
+# Like a plain substring check, markers may match inside words ("is" in "this").
+_OPINION_RE = re.compile("|".join(map(re.escape, OPINION_MARKERS)))
+_FACTUAL_RE = re.compile("|".join(map(re.escape, FACTUAL_INDICATORS)))
 
 
 def extract_claims(text: str) -> List[str]:
@@ -25,67 +62,65 @@ def extract_claims(text: str) -> List[str]:
     Returns:
         List of extracted claim strings
     """
-    if not text or not text.strip():
+    text = text.strip() if text else ""
+    if not text:
         return []
 
-    # Simple sentence splitting (handles ., !, ?)
-    # In production, use proper NLP sentence tokenizer
-    sentences = re.split(r"(?<=[.!?])\s+", text.strip())
-
-    claims = []
-    for sentence in sentences:
-        sentence = sentence.strip()
-
-        # Skip empty or very short sentences
-        if len(sentence) < 10:
-            continue
-
-        # Skip questions (not factual claims)
-        if sentence.endswith("?"):
-            continue
-
-        # Skip sentences that are clearly opinions (mock logic)
-        opinion_markers = ["i think", "i believe", "in my opinion", "maybe", "perhaps"]
-        if any(marker in sentence.lower() for marker in opinion_markers):
-            continue
-
-        # Keep sentences that contain factual indicators (mock heuristic)
-        # In reality, this would be much more sophisticated
-        factual_indicators = [
-            "is",
-            "are",
-            "was",
-            "were",
-            "has",
-            "have",
-            "had",
-            "percent",
-            "%",
-            "million",
-            "billion",
-            "year",
-            "founded",
-            "located",
-            "discovered",
-            "invented",
-            "created",
-            "published",
-        ]
-
-        # If sentence contains numbers or factual indicators, likely a claim
-        has_numbers = bool(re.search(r"\d+", sentence))
-        has_factual_words = any(word in sentence.lower() for word in factual_indicators)
-
-        if has_numbers or has_factual_words or len(sentence) > 30:
-            claims.append(sentence)
+    # Split, strip and filter sentences in a single streaming pass
+    claims = [
+        sentence
+        for sentence in map(str.strip, _iter_sentences(text))
+        if _is_claim(sentence)
+    ]
 
     # If no claims found but text exists, treat whole text as one claim
-    if not claims and text.strip():
-        claims = [text.strip()[:500]]  # Limit length
+    if not claims:
+        claims = [text[:500]]  # Limit length
 
     return claims
 
 
+def _iter_sentences(text: str) -> Iterator[str]:
+    """
+    Lazily yield the sentences of text (handles ., !, ?).
+
+    Simple sentence splitting - in production, use a proper NLP sentence
+    tokenizer.
+    """
+    start = 0
+    for boundary in _SENTENCE_BOUNDARY.finditer(text):
+        yield text[start : boundary.start()]
+        start = boundary.end()
+    yield text[start:]
+
+
+def _is_claim(sentence: str) -> bool:
+    """
+    Decide whether a (stripped) sentence looks like a factual claim.
+    """
+    # Skip empty or very short sentences
+    if len(sentence) < 10:
+        return False
+
+    # Skip questions (not factual claims)
+    if sentence.endswith("?"):
+        return False
+
+    sentence_lower = sentence.lower()
+
+    # Skip sentences that are clearly opinions
+    if _OPINION_RE.search(sentence_lower):
+        return False
+
+    # Long sentences, or ones containing numbers or factual indicators,
+    # are likely claims (cheapest check first)
+    return (
+        len(sentence) > 30
+        or bool(_NUMBER_RE.search(sentence))
+        or bool(_FACTUAL_RE.search(sentence_lower))
+    )
+
+
 def count_claims(text: str) -> int:
     """
     Quick count of claims without full extraction.